@@ -1,17 +1,18 @@
 import streamlit as st
 import pandas as pd
 import model
+import helper
+import shared_cache
 from streamlit_folium import folium_static
 import os
 
-# Cache loading of data
-@st.cache_data
+# Cache loading of data in shared memory so every session and worker reads the same copy
 def load_data(city_dir, store):
-    return model.load_data(city_dir, store)
+    return shared_cache.get_frame(model.load_data, city_dir, store, sources=[f'./{city_dir}/{store}.csv'])
 
 # Define directories and load initial data
 city_directories = {'Bangalore': 'blr', 'Mysore': 'mys'}
-stores_df = pd.read_excel('Store_Info_Latitude_Longitude.xlsx')
+stores_df = shared_cache.get_frame(helper.load_store_locations, sources=['Store_Info_Latitude_Longitude.xlsx'])
 stores_df = stores_df[stores_df['Town_x'].isin(['Bengaluru', 'Mysore'])]
 
 page = st.query_params.get('page', [''])[0]
@@ -51,8 +52,10 @@ if city:
 
             st.markdown("#### 2. Hotspot Plot")
             st.write("This plot highlights the areas with the highest concentration of data points for different property types.")
+            st.write("Hotspots and coldspots are landmarks with a significant Getis-Ord Gi* score (95% confidence) within the selected neighbourhood distance.")
 
-            hotspot_plot = model.create_hotspot_plot(df)
+            threshold_km = st.slider("Neighbourhood Distance (km)", min_value=0.1, max_value=2.0, value=0.5, step=0.1)
+            hotspot_plot = model.create_hotspot_plot(df, threshold_km)
             st.pyplot(hotspot_plot)
 
             # boxplot = model.create_boxplot(df)
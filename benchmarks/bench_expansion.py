@@ -0,0 +1,68 @@
+# Benchmark the expansion page: file reads, table bytes sent to the browser and render time
+import os
+import sys
+import time
+import pandas as pd
+import pyarrow as pa
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from helper import load_expansion_data, filter_table, get_page, create_store_map, create_hexbin_plot, create_folium_map, create_competitor_plot
+
+PAGE_SIZE = 50
+REPEATS = 5
+
+def arrow_bytes(df):
+    # st.dataframe serializes frames to Arrow IPC before sending them to the browser
+    table = pa.Table.from_pandas(df)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().size
+
+def render_figures(df, stores_df):
+    create_store_map(stores_df).get_root().render()
+    create_hexbin_plot(df).to_json()
+    create_folium_map(df).get_root().render()
+    create_competitor_plot(df).to_json()
+
+def load_before(file_path):
+    # Every helper used to read the file itself and the page read it a fourth time
+    stores_df = pd.read_excel('Store_Info_Latitude_Longitude.xlsx')
+    frames = [pd.read_csv(file_path) for _ in range(4)]
+    return frames[-1], stores_df
+
+def render_before(file_path):
+    df, stores_df = load_before(file_path)
+    render_figures(df, stores_df)
+    return arrow_bytes(df)
+
+def render_after(df, stores_df):
+    render_figures(df, stores_df)
+    return arrow_bytes(get_page(filter_table(df, sort_by='name'), 1, PAGE_SIZE))
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        result = fn(*args)
+    return result, (time.perf_counter() - start) / REPEATS * 1000
+
+def main():
+    files = [os.path.join('locations', f) for f in os.listdir('locations') if f.endswith('_expansion_areas.csv')]
+    file_path = max(files, key=os.path.getsize)
+    print(f"File: {file_path} ({os.path.getsize(file_path)} bytes)")
+
+    _, load_ms = timed(load_before, file_path)
+    bytes_before, ms_before = timed(render_before, file_path)
+
+    # The page loads through the shared cache, so after the first visit no render reads the files
+    df = load_expansion_data(file_path)
+    stores_df = pd.read_excel('Store_Info_Latitude_Longitude.xlsx')
+    bytes_after, ms_after = timed(render_after, df, stores_df)
+
+    print(f"Rows: {len(df)}")
+    print(f"Reads removed per render: {load_ms:8.1f} ms")
+    print(f"Before: {bytes_before:>8} table bytes  {ms_before:8.1f} ms per render")
+    print(f"After:  {bytes_after:>8} table bytes  {ms_after:8.1f} ms per render")
+
+if __name__ == "__main__":
+    main()
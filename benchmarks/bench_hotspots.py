@@ -0,0 +1,53 @@
+# Benchmark sparse distance-band weights and local statistics across data sizes
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import spatial
+
+SIZES = [1_000, 10_000, 100_000, 300_000]
+THRESHOLD_KM = 0.5
+DENSITY_PER_KM2 = 100  # roughly the landmark density around the Bangalore stores
+DENSE_LIMIT = 10_000
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+def dense_gi_star(points, values):
+    # Naive O(n^2) reference with a full distance matrix
+    distances = np.linalg.norm(points[:, None, :] - points[None, :, :], axis=2)
+    weights = (distances < THRESHOLD_KM).astype(float)
+    n = len(values)
+    weight_sums = weights.sum(axis=1)
+    std = np.sqrt((values ** 2).mean() - values.mean() ** 2)
+    numerator = weights @ values - values.mean() * weight_sums
+    return numerator / (std * np.sqrt((n * weight_sums - weight_sums ** 2) / (n - 1)))
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'n':>8} {'neighbours':>10} {'weights ms':>11} {'gi* ms':>8} {'moran ms':>9} {'dense ms':>9}")
+    for n in SIZES:
+        side_km = np.sqrt(n / DENSITY_PER_KM2)
+        points = rng.uniform(0, side_km, size=(n, 2))
+        values = rng.poisson(3, size=n).astype(float)
+
+        weights, weights_ms = timed(spatial.distance_band_weights, points, THRESHOLD_KM, include_self=True)
+        gi_star, gi_ms = timed(spatial.getis_ord_gi_star, values, weights)
+        no_self = spatial.distance_band_weights(points, THRESHOLD_KM)
+        _, moran_ms = timed(spatial.local_morans_i, values, no_self)
+
+        dense = "-"
+        if n <= DENSE_LIMIT:
+            reference, dense_ms = timed(dense_gi_star, points, values)
+            assert np.allclose(reference, gi_star)
+            dense = f"{dense_ms:.1f}"
+
+        neighbours = weights.nnz / n
+        print(f"{n:>8} {neighbours:>10.1f} {weights_ms:>11.1f} {gi_ms:>8.1f} {moran_ms:>9.1f} {dense:>9}")
+
+if __name__ == "__main__":
+    main()
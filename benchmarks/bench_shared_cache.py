@@ -0,0 +1,92 @@
+# Measure memory of concurrent sessions with st.cache_data copies versus the shared cache (Linux only)
+import gc
+import multiprocessing as mp
+import os
+import pickle
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import model
+import shared_cache
+
+SESSIONS = 20
+WORKERS = [1, 4]
+CITY_DIRS = ['blr', 'mys']
+
+def store_keys():
+    return [(city_dir, f[:-4]) for city_dir in CITY_DIRS for f in os.listdir(city_dir) if f.endswith('.csv')]
+
+def pss_bytes(pid):
+    # Proportional set size splits shared pages between the processes that map them
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            if line.startswith('Pss:'):
+                return int(line.split()[1]) * 1024
+    return 0
+
+def session_copies(keys):
+    # st.cache_data keeps pickled bytes per process and unpickles a fresh copy for every session
+    pickled = {key: pickle.dumps(model.load_data(*key)) for key in keys}
+    return lambda key: pickle.loads(pickled[key])
+
+def session_views(keys):
+    return lambda key: shared_cache.get_frame(model.load_data, *key, sources=[f'./{key[0]}/{key[1]}.csv'])
+
+def read_columns(df):
+    # Touch every column the way rendering does, so mapped pages are actually resident
+    df['Distance'].sum()
+    df['Landmark Latitude'].mean()
+    df['Landmark Longitude'].mean()
+    df['Property Type'].value_counts()
+    df['Landmark Name'].str.len().sum()
+
+def worker(mode, sessions, loaded, done):
+    keys = store_keys()
+    frames = []
+    if mode != 'idle':
+        load = session_copies(keys) if mode == 'copies' else session_views(keys)
+        frames = [[load(key) for key in keys] for _ in range(sessions)]
+        for session in frames:
+            for df in session:
+                read_columns(df)
+    loaded.wait()
+    done.wait()
+
+def measure(mode, workers):
+    # Total PSS of all workers while every session holds its frames
+    ctx = mp.get_context('fork')
+    # Keep the garbage collector from dirtying pages inherited from the parent
+    gc.freeze()
+    loaded, done = ctx.Barrier(workers + 1), ctx.Barrier(workers + 1)
+    processes = [ctx.Process(target=worker, args=(mode, SESSIONS // workers, loaded, done)) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    loaded.wait()
+    total = sum(pss_bytes(process.pid) for process in processes)
+    done.wait()
+    for process in processes:
+        process.join()
+    return total
+
+def main():
+    shared_cache.CACHE_DIR = tempfile.mkdtemp(prefix='dashboard_cache_')
+    keys = store_keys()
+    for key in keys:
+        shared_cache.get_frame(model.load_data, *key, sources=[f'./{key[0]}/{key[1]}.csv'])
+    shared_cache._frames.clear()
+
+    csv_bytes = sum(os.path.getsize(f'./{city_dir}/{store}.csv') for city_dir, store in keys)
+    print(f"{len(keys)} store files ({csv_bytes / 2**20:.1f} MiB of CSV), {SESSIONS} sessions")
+    for workers in WORKERS:
+        idle = measure('idle', workers)
+        copies = measure('copies', workers) - idle
+        views = measure('views', workers) - idle
+        print(f"{workers} worker(s): st.cache_data copies {copies / 2**20:7.1f} MiB   shared cache {views / 2**20:7.1f} MiB")
+
+    shared_cache.clear()
+    os.rmdir(shared_cache.CACHE_DIR)
+
+if __name__ == "__main__":
+    main()
@@ -4,14 +4,34 @@ import plotly.graph_objects as go
 import random
 import plotly.express as px
 
-def load_store_locations(file_path='Store_Info_Latitude_Longitude.xlsx'):
+def load_store_locations(file_path='Store_Info_Latitude_Longitude.xlsx', towns=None):
     df = pd.read_excel(file_path)
-    df = df[df['Town_x'].isin(['Bengaluru', 'Mysore'])]
+    if towns is not None:
+        df = df[df['Town_x'].isin(towns)]
     return df
 
-def create_store_map(file_path='Store_Info_Latitude_Longitude.xlsx'):
-    df = pd.read_excel(file_path)
+def load_expansion_data(file_path):
+    return pd.read_csv(file_path)
+
+def filter_table(df, search='', property_types=None, sort_by=None, ascending=True):
+    # Filter and sort on the server instead of shipping the whole table to the browser
+    if property_types:
+        df = df[df['Property Type'].isin(property_types)]
+    if search:
+        df = df[df['name'].str.contains(search, case=False, na=False, regex=False)]
+    if sort_by:
+        df = df.sort_values(sort_by, ascending=ascending, kind='stable')
+    return df
+
+def count_pages(df, page_size=50):
+    return max(1, -(-len(df) // page_size))
+
+def get_page(df, page=1, page_size=50):
+    page = min(max(1, page), count_pages(df, page_size))
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size]
 
+def create_store_map(df):
     if not df.empty:
         map_center = [df['Latitude_x'].iloc[0], df['Longitude_x'].iloc[0]]
     else:
@@ -27,11 +47,7 @@ def create_store_map(file_path='Store_Info_Latitude_Longitude.xlsx'):
 
     return store_map
 
-def create_hexbin_plot(file_path):
-    file_path=file_path.replace('expansion\\', 'locations\\')
-
-    df = pd.read_csv(file_path)
-
+def create_hexbin_plot(df):
     property_types = df['Property Type'].unique()
     buttons = []
 
@@ -76,10 +92,7 @@ def get_random_color():
               'cadetblue', 'darkpurple', 'white', 'pink', 'lightblue', 'lightgreen', 'gray', 'black', 'lightgray']
     return random.choice(colors)
 
-def create_folium_map(filepath):
-    filepath = filepath.replace('expansion\\', 'locations\\')
-    df = pd.read_csv(filepath)
-    
+def create_folium_map(df):
     center_lat = df['latitude'].mean()
     center_lon = df['longitude'].mean()
     store_location = [center_lat, center_lon]
@@ -108,10 +121,7 @@ def create_folium_map(filepath):
 
     return map_folium
 
-def create_competitor_plot(filepath):
-    filepath=filepath.replace('expansion\\', 'locations\\')
-    df = pd.read_csv(filepath)
-
+def create_competitor_plot(df):
     # Filter the dataframe for specific landmarks
     landmarks_to_plot = ['Reliance Trends', 'Zudio', 'Westside']
     filtered_df = df[df['name'].isin(landmarks_to_plot)]
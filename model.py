@@ -5,10 +5,10 @@ import seaborn as sns
 import matplotlib.pyplot as plt
 import numpy as np
 from geopy.distance import geodesic
-from scipy.stats import zscore
 import plotly.graph_objects as go
 import folium
 import random
+import spatial
 
 def load_data(city, store):
     filepath = f'./{city}/{store}.csv'
@@ -109,22 +109,25 @@ def create_kde_plot(df, store_location):
     plt.tight_layout()
     return fig_kde
 
-def create_hotspot_plot(df):
+def create_hotspot_plot(df, threshold_km=0.5, critical_z=1.96):
     property_types = df['Property Type'].unique()
     num_cols_hotspot = 4
     num_rows_hotspot = int(np.ceil(len(property_types) / num_cols_hotspot))
     fig_hotspot = plt.figure(figsize=(18, 14))
 
+    # Getis-Ord Gi* z-scores of each property type within the neighbourhood distance
+    gi_star = spatial.property_type_hotspots(df, threshold_km)
+
     for i, property_type in enumerate(property_types, start=1):
-        subset_data = df[df['Property Type'] == property_type]
-        distances = subset_data['Distance']
-        standardized_distances = zscore(distances)
-        hotspots = subset_data[standardized_distances > 0.5]
-        coldspots = subset_data[standardized_distances < -0.5]
+        is_type = (df['Property Type'] == property_type).to_numpy()
+        subset_data = df[is_type]
+        z_scores = gi_star[property_type][is_type]
+        hotspots = subset_data[z_scores > critical_z]
+        coldspots = subset_data[z_scores < -critical_z]
         plt.subplot(num_rows_hotspot, num_cols_hotspot, i)
         plt.scatter(subset_data['Landmark Longitude'], subset_data['Landmark Latitude'], c='lightgray')
-        plt.scatter(hotspots['Landmark Longitude'], hotspots['Landmark Latitude'], c='blue', label='Hotspots')
-        plt.scatter(coldspots['Landmark Longitude'], coldspots['Landmark Latitude'], c='red', label='Coldspots')
+        plt.scatter(hotspots['Landmark Longitude'], hotspots['Landmark Latitude'], c='red', label='Hotspots')
+        plt.scatter(coldspots['Landmark Longitude'], coldspots['Landmark Latitude'], c='blue', label='Coldspots')
         plt.xlabel('Longitude')
         plt.ylabel('Latitude')
         plt.title(f'Hotspot Analysis of {property_type} around Store')
@@ -1,9 +1,14 @@
 import streamlit as st
+import sys
 import os
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+# Add parent directory to sys.path to import the shared cache
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import shared_cache
+
 def render():
     st.title("Comparative Analysis for Bangalore")
 
@@ -44,6 +49,13 @@ def render():
         competitor_df = pd.DataFrame(competitor_counts).fillna(0).T
         return competitor_df
 
+    # City aggregates are cached in shared memory and rebuilt when any store file changes
+    def load_comparison_df(directory):
+        return create_comparison_df(count_property_types(directory))
+
+    def load_competitor_comparison_df(directory, competitors):
+        return create_competitor_comparison_df(count_competitor_landmarks(directory, competitors))
+
     def plot_separate_analysis(comparison_df):
         # Define a soft color palette with three complementary colors
         soft_colors = sns.color_palette("pastel", 3)
@@ -85,19 +97,19 @@ def render():
         directory = './blr'
         competitors = ['Reliance Trends', 'Westside', 'Zudio']
 
-        property_counts = count_property_types(directory)
+        csv_files = [os.path.join(directory, f) for f in os.listdir(directory) if f.endswith('.csv')]
+
+        comparison_df = shared_cache.get_frame(load_comparison_df, directory, sources=csv_files)
 
-        competitor_counts = count_competitor_landmarks(directory, competitors)
+        competitor_df = shared_cache.get_frame(load_competitor_comparison_df, directory, competitors, sources=csv_files)
         
-        if competitor_counts:
-            competitor_df = create_competitor_comparison_df(competitor_counts)
+        if not competitor_df.empty:
             plot_heatmap(competitor_df)  # Display heatmap
             plot_competitor_analysis(competitor_df)  # Display bar plot for competitor analysis
         else:
             st.warning("No competitor landmarks found in the directory.")
 
-        if property_counts:
-            comparison_df = create_comparison_df(property_counts)
+        if not comparison_df.empty:
             plot_separate_analysis(comparison_df)  # Display separate analysis bar plots
         else:
             st.warning("No CSV files found in the directory.")
@@ -8,13 +8,24 @@ import plotly.express as px
 
 # Add parent directory to sys.path to import helper functions
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from helper import create_store_map, create_hexbin_plot, create_folium_map, create_competitor_plot
+from helper import load_store_locations, load_expansion_data, filter_table, count_pages, get_page, create_store_map, create_hexbin_plot, create_folium_map, create_competitor_plot
+import shared_cache
+
+PAGE_SIZE = 50
+
+# Cache loading of data so each file is read once and shared by every plot, session and worker
+def load_stores():
+    # Same cache entry as the store list in app.py
+    return shared_cache.get_frame(load_store_locations, sources=['Store_Info_Latitude_Longitude.xlsx'])
+
+def load_data(file_path):
+    return shared_cache.get_frame(load_expansion_data, file_path, sources=[file_path])
 
 def render():
     st.title("Expansion Analysis")
 
     st.write("Store locations on the map:")
-    store_map = create_store_map()
+    store_map = create_store_map(load_stores())
     folium_static(store_map)
 
     # Get list of CSV files in the directory
@@ -29,21 +40,33 @@ def render():
 
     if selected_file:
         file_path = os.path.join('locations', selected_file)
+        df = load_data(file_path)
 
-        hexbin_plot = create_hexbin_plot(file_path)
+        hexbin_plot = create_hexbin_plot(df)
         st.plotly_chart(hexbin_plot)
 
-        folium_plot = create_folium_map(file_path)
+        folium_plot = create_folium_map(df)
         folium_static(folium_plot)
         
-        comp_plot = create_competitor_plot(file_path)
+        comp_plot = create_competitor_plot(df)
         st.plotly_chart(comp_plot)
 
-
-        # Read and display the CSV file
-        df = pd.read_csv(file_path)
+        # Filter, sort and paginate the table so only the visible rows are sent
         st.write("CSV File Contents:")
-        st.dataframe(df)
+        col1, col2 = st.columns(2)
+        with col1:
+            search = st.text_input("Search by Name")
+            sort_by = st.selectbox("Sort By", [None] + list(df.columns), format_func=lambda column: column or "File order")
+        with col2:
+            selected_property_types = st.multiselect("Filter Property Types", options=df['Property Type'].unique())
+            ascending = st.radio("Order", ["Ascending", "Descending"], horizontal=True) == "Ascending"
+
+        filtered_df = filter_table(df, search, selected_property_types, sort_by, ascending)
+        num_pages = count_pages(filtered_df, PAGE_SIZE)
+        page = st.number_input("Page", min_value=1, max_value=num_pages, value=1, step=1)
+
+        st.write(f"Showing page {page} of {num_pages} ({len(filtered_df)} rows)")
+        st.dataframe(get_page(filtered_df, page, PAGE_SIZE))
 
 if __name__ == "__main__":
     render()
\ No newline at end of file
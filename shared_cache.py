@@ -0,0 +1,158 @@
+#shared_cache.py
+import functools
+import hashlib
+import inspect
+import os
+import tempfile
+import threading
+import time
+import pandas as pd
+import pyarrow as pa
+
+# Frames are written once as Arrow IPC files and memory-mapped by every worker process,
+# so all sessions read the same pages from the OS page cache instead of private copies.
+# The budget caps the files on disk; every get_frame call drops this process's views of
+# evicted files, so mapped memory follows the budget once sessions release their copies
+CACHE_DIR = os.environ.get('DASHBOARD_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'dashboard_cache'))
+MEMORY_BUDGET = int(float(os.environ.get('DASHBOARD_CACHE_BUDGET_MB', 256)) * 1024 * 1024)
+
+# Bump when a loader's helpers change what it returns, since only the loader's own source is hashed
+CACHE_VERSION = 1
+
+# Temp files older than this belong to writers that crashed
+STALE_TMP_SECONDS = 600
+
+# Views already attached by this process, only for files still in the cache directory.
+# Streamlit runs sessions as threads, so the lock guards _frames and the load-and-write path
+_frames = {}
+_lock = threading.RLock()
+
+def get_frame(loader, *args, sources=()):
+    # Return a read-only view of loader(*args), loading and caching it on first use.
+    # Each call gets its own shallow copy, so adding or replacing columns in one session
+    # doesn't leak into others, while the column data stays shared and read-only
+    path = _cache_path(loader, args, sources)
+
+    with _lock:
+        _release_evicted()
+        if path in _frames:
+            _touch(path)
+        else:
+            try:
+                _frames[path] = _map(path)
+                _touch(path)
+            except FileNotFoundError:
+                # Not cached yet, or another worker evicted it between our check and the mapping
+                _frames[path] = _write(loader(*args), path)
+                evict(MEMORY_BUDGET, keep=path)
+        frame = _frames[path]
+
+    return frame.copy(deep=False)
+
+def evict(budget=MEMORY_BUDGET, keep=None):
+    # Remove least recently used files until the cache fits in the budget
+    if not os.path.isdir(CACHE_DIR):
+        return
+
+    stats = {}
+    for name in os.listdir(CACHE_DIR):
+        path = os.path.join(CACHE_DIR, name)
+        try:
+            stats[path] = os.stat(path)
+        except FileNotFoundError:
+            continue
+        # Leftovers of crashed writers are removed; ones still being written count towards the budget
+        if name.endswith('.tmp') and time.time() - stats[path].st_mtime > STALE_TMP_SECONDS:
+            _remove(path)
+            del stats[path]
+
+    total = sum(stat.st_size for stat in stats.values())
+    arrow_files = [(path, stat) for path, stat in stats.items() if path.endswith('.arrow')]
+    with _lock:
+        for path, stat in sorted(arrow_files, key=lambda item: item[1].st_mtime):
+            if total <= budget:
+                break
+            if path == keep or not _remove(path):
+                continue
+            _frames.pop(path, None)
+            total -= stat.st_size
+
+def clear():
+    with _lock:
+        _frames.clear()
+        evict(budget=0)
+
+def _cache_path(loader, args, sources):
+    # Key on the loader's code, its arguments and the source files, so both code
+    # changes and edited files are reloaded
+    key = f'{CACHE_VERSION}|{loader.__module__}.{loader.__qualname__}{args!r}|{_code_hash(loader.__code__)}'
+    for source in sources:
+        stat = os.stat(source)
+        key += f'|{source}:{stat.st_mtime_ns}:{stat.st_size}'
+    return os.path.join(CACHE_DIR, hashlib.sha1(key.encode()).hexdigest() + '.arrow')
+
+@functools.lru_cache(maxsize=None)
+def _code_hash(code):
+    # Hash the source once per code object; nested loaders are recreated on every rerun
+    try:
+        source = inspect.getsource(code).encode()
+    except (OSError, TypeError):
+        source = code.co_code
+    return hashlib.sha1(source).hexdigest()
+
+def _write(df, path):
+    # Mixed-type object columns (e.g. street names that are sometimes numbers) can't go to Arrow as-is
+    object_columns = df.select_dtypes(include='object').columns
+    if len(object_columns):
+        df = df.astype({column: 'string' for column in object_columns})
+    table = pa.Table.from_pandas(df)
+
+    # Write to a unique private file first so other threads and processes never map a partial file
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, prefix=os.path.basename(path) + '.', suffix='.tmp')
+    os.close(fd)
+    try:
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+        # Map the private file before publishing it, so the view survives even if the
+        # final file is evicted straight away
+        df = _map(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        _remove(tmp_path)
+        raise
+    return df
+
+def _release_evicted():
+    # Drop views of files removed by any process, so their mappings can be freed
+    cached = set(os.listdir(CACHE_DIR)) if os.path.isdir(CACHE_DIR) else set()
+    for path in list(_frames):
+        if os.path.basename(path) not in cached:
+            del _frames[path]
+
+def _map(path):
+    # Numeric columns become read-only numpy views of the mapped buffers and string columns
+    # stay Arrow-backed, so no column data is copied
+    table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+    return table.to_pandas(split_blocks=True, types_mapper=_string_dtype)
+
+def _string_dtype(arrow_type):
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return pd.ArrowDtype(arrow_type)
+    return None
+
+def _remove(path):
+    # Processes that already mapped the file keep a valid view until they drop it
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
+
+def _touch(path):
+    try:
+        os.utime(path)
+    except OSError:
+        pass
@@ -0,0 +1,65 @@
+#spatial.py
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from scipy.spatial import cKDTree
+
+EARTH_RADIUS_KM = 6371.0088
+
+def project_to_km(latitudes, longitudes):
+    # Equirectangular projection around the mean latitude, accurate enough at city scale
+    lat = np.radians(np.asarray(latitudes, dtype=float))
+    lon = np.radians(np.asarray(longitudes, dtype=float))
+    x = EARTH_RADIUS_KM * lon * np.cos(lat.mean())
+    y = EARTH_RADIUS_KM * lat
+    return np.column_stack([x, y])
+
+def distance_band_weights(points, threshold_km, include_self=False):
+    # Binary weights for every pair closer than the threshold, found with a KD-tree instead of all n^2 pairs
+    n = len(points)
+    pairs = cKDTree(points).query_pairs(threshold_km, output_type='ndarray')
+    rows = np.concatenate([pairs[:, 0], pairs[:, 1]])
+    cols = np.concatenate([pairs[:, 1], pairs[:, 0]])
+    if include_self:
+        rows = np.concatenate([rows, np.arange(n)])
+        cols = np.concatenate([cols, np.arange(n)])
+    data = np.ones(len(rows), dtype=float)
+    return sp.csr_matrix((data, (rows, cols)), shape=(n, n))
+
+def getis_ord_gi_star(values, weights):
+    # Gi* z-scores for one variable (1-D) or several variables at once (n x k); weights must include self
+    x = np.asarray(values, dtype=float)
+    n = x.shape[0]
+    mean = x.mean(axis=0)
+    std = np.sqrt((x ** 2).mean(axis=0) - mean ** 2)
+
+    weight_sums = np.asarray(weights.sum(axis=1)).ravel()
+    squared_weight_sums = np.asarray(weights.multiply(weights).sum(axis=1)).ravel()
+    if x.ndim > 1:
+        weight_sums = weight_sums[:, None]
+        squared_weight_sums = squared_weight_sums[:, None]
+
+    numerator = weights @ x - mean * weight_sums
+    denominator = std * np.sqrt((n * squared_weight_sums - weight_sums ** 2) / (n - 1))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return numerator / denominator
+
+def local_morans_i(values, weights):
+    # Local Moran's I for one variable (1-D) or several variables at once (n x k); weights must exclude self
+    x = np.asarray(values, dtype=float)
+    deviations = x - x.mean(axis=0)
+    variance = (deviations ** 2).mean(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return deviations / variance * (weights @ deviations)
+
+def property_type_hotspots(df, threshold_km=0.5, lat_col='Landmark Latitude', lon_col='Landmark Longitude',
+                           type_col='Property Type'):
+    # Gi* of each property type's indicator over all landmarks, sharing one weight matrix across types
+    points = project_to_km(df[lat_col], df[lon_col])
+    weights = distance_band_weights(points, threshold_km, include_self=True)
+    codes, property_types = pd.factorize(df[type_col])
+    indicators = np.zeros((len(df), len(property_types)))
+    has_type = codes >= 0
+    indicators[np.flatnonzero(has_type), codes[has_type]] = 1.0
+    z_scores = getis_ord_gi_star(indicators, weights)
+    return {property_type: z_scores[:, i] for i, property_type in enumerate(property_types)}